@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, DefaultDict, Dict, List, Optional, Tuple,
 import pandas as pd
 import requests
 from pydantic import ValidationError
+from qcelemental.util.serialization import serialize
 
 from .collections import collection_factory, collections_name_map
 from .models import build_procedure
@@ -238,7 +239,13 @@ class FractalClient(object):
         return r
 
     def _automodel_request(
-        self, name: str, rest: str, payload: Dict[str, Any], full_return: bool = False, timeout: int = None
+        self,
+        name: str,
+        rest: str,
+        payload: Dict[str, Any],
+        full_return: bool = False,
+        timeout: int = None,
+        trusted: bool = False,
     ) -> Any:
         """Automatic model request profiling and creation using rest_models
 
@@ -254,6 +261,8 @@ class FractalClient(object):
             Returns the full server response if True that contains additional metadata.
         timeout : int, optional
             Timeout time
+        trusted : bool, optional
+            If True, the payload is known to be valid and is serialized without building the body model.
 
         Returns
         -------
@@ -265,13 +274,16 @@ class FractalClient(object):
 
         body_model, response_model = rest_model(sname, rest)
 
-        # Provide a reasonable traceback
-        try:
-            payload = body_model(**payload)
-        except ValidationError as exc:
-            raise TypeError(str(exc))
+        if trusted:
+            data = serialize(payload, self.encoding)
+        else:
+            # Provide a reasonable traceback
+            try:
+                data = body_model(**payload).serialize(self.encoding)
+            except ValidationError as exc:
+                raise TypeError(str(exc))
 
-        r = self._request(rest, name, data=payload.serialize(self.encoding), timeout=timeout)
+        r = self._request(rest, name, data=data, timeout=timeout)
         encoding = r.headers["Content-Type"].split("/")[1]
         response = response_model.parse_raw(r.content, encoding=encoding)
 
@@ -597,12 +609,12 @@ class FractalClient(object):
 
         # Watching for nothing found
         if len(response.data):
-            return collection_factory(response.data[0], client=self)
+            return collection_factory(response.data[0], client=self, trusted=True)
         else:
             raise KeyError("Collection '{}:{}' not found.".format(collection_type, name))
 
     def add_collection(
-        self, collection: Dict[str, Any], overwrite: bool = False, full_return: bool = False
+        self, collection: Dict[str, Any], overwrite: bool = False, full_return: bool = False, trusted: bool = False
     ) -> Union["CollectionGETResponse", List["ObjectId"]]:
         """Adds a new Collection to the server.
 
@@ -614,6 +626,9 @@ class FractalClient(object):
             Overwrites the collection if it already exists in the database, used for updating collection.
         full_return : bool, optional
             Returns the full server response if True that contains additional metadata.
+        trusted : bool, optional
+            If True, the collection is already a complete and valid representation (such as the output of
+            ``Collection.data.dict()``) and is sent without client-side validation.
 
         Returns
         -------
@@ -627,7 +642,7 @@ class FractalClient(object):
             raise KeyError("Attempting to overwrite collection, but no server ID found (cannot use 'local').")
 
         payload = {"meta": {"overwrite": overwrite}, "data": collection}
-        return self._automodel_request("collection", "post", payload, full_return=full_return)
+        return self._automodel_request("collection", "post", payload, full_return=full_return, trusted=trusted)
 
     def delete_collection(self, collection_type: str, name: str) -> None:
         """Deletes a given collection from the server.
@@ -5,11 +5,17 @@ Helper
 """
 
 import abc
-import copy
-import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Type, Union
 
+import numpy as np
 import pandas as pd
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_SINGLETON
+from qcelemental.util.serialization import serialize
 
 from ..models import ProtoModel
 
@@ -18,6 +24,115 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..models import ObjectId
 
 
+# Types that come back from the server exactly as the model stores them
+_native_types = (str, int, float, bool, Any, type(None))
+
+
+def _is_native(tp: Any) -> bool:
+    if tp in _native_types:
+        return True
+
+    # Dict, List and Union (Optional) made only of native types
+    if getattr(tp, "__origin__", None) in (dict, list, Union):
+        return all(_is_native(x) for x in tp.__args__)
+
+    return False
+
+
+@lru_cache(maxsize=None)
+def _trusted_plan(model: Type[BaseModel]) -> Optional[Dict[str, str]]:
+    """
+    How each field of a model is built from trusted data: taken as-is ("native"),
+    constructed as (a list or dict of) sub-models ("model"), or validated ("validate").
+
+    Returns None if the model has root validators and must always be validated.
+    """
+
+    if model.__pre_root_validators__ or model.__post_root_validators__:
+        return None
+
+    plan = {}
+    for name, field in model.__fields__.items():
+        if field.class_validators:
+            plan[name] = "validate"
+        elif _is_native(field.outer_type_):
+            plan[name] = "native"
+        elif (
+            isinstance(field.type_, type)
+            and issubclass(field.type_, BaseModel)
+            and field.shape in (SHAPE_SINGLETON, SHAPE_LIST, SHAPE_DICT)
+        ):
+            plan[name] = "model"
+        else:
+            plan[name] = "validate"
+
+    return plan
+
+
+def _construct_trusted(model: Type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """
+    Builds a model from data that was already validated (i.e., from the server), skipping
+    validation wherever the stored value is already the right type.
+
+    Fields needing conversion (sets, tuples, enums, arrays, ...) or carrying validators are
+    still validated, and anything unexpected falls back on full validation. Only use this
+    on data that came from the model itself.
+    """
+
+    if isinstance(data, model):
+        return data
+
+    plan = _trusted_plan(model)
+    if plan is None or not isinstance(data, dict) or not data.keys() <= plan.keys():
+        return model.validate(data)
+
+    values = {}
+    for name, value in data.items():
+        how = plan[name]
+        field = model.__fields__[name]
+
+        if how == "native" or value is None:
+            values[name] = value
+        elif how == "model":
+            sub = field.type_
+            if field.shape == SHAPE_SINGLETON:
+                values[name] = _construct_trusted(sub, value)
+            elif field.shape == SHAPE_LIST:
+                values[name] = [_construct_trusted(sub, v) for v in value]
+            else:
+                values[name] = {k: _construct_trusted(sub, v) for k, v in value.items()}
+        else:
+            values[name], errors = field.validate(value, values, loc=name, cls=model)
+            if errors:
+                raise ValidationError([errors], model)
+
+    # Missing required fields are an error, let validation report them
+    if any(f.required and name not in values for name, f in model.__fields__.items()):
+        return model.validate(data)
+
+    return model.construct(_fields_set=set(data), **values)
+
+
+def _chunked_requests(func: Callable[[List[Any]], List[Any]], items: List[Any], chunk_size: int, max_workers: int = 1):
+    """
+    Calls func on chunks of items and concatenates the results, keeping the order of the items
+
+    func makes one server request per chunk, either a query or an add. The chunks must be
+    independent of each other, so with max_workers > 1 the requests are made concurrently
+    from a thread pool.
+    """
+
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    if max_workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            results = list(executor.map(func, chunks))
+    else:
+        results = [func(chunk) for chunk in chunks]
+
+    return [x for result in results for x in result]
+
+
 class Collection(abc.ABC):
     def __init__(self, name: str, client: Optional["FractalClient"] = None, **kwargs: Any):
         """
@@ -45,8 +160,11 @@ class Collection(abc.ABC):
 
         kwargs["name"] = name
 
-        # Create the data model
-        self.data = self.DataModel(**kwargs)
+        # Create the data model. Data from the server was validated when it was stored
+        if kwargs.pop("_trusted", False):
+            self.data = _construct_trusted(self.DataModel, kwargs)
+        else:
+            self.data = self.DataModel(**kwargs)
 
     class DataModel(ProtoModel):
         """
@@ -144,10 +262,10 @@ class Collection(abc.ABC):
         if tmp_data.meta.n_found == 0:
             raise KeyError("Warning! `{}: {}` not found.".format(class_name, name))
 
-        return cls.from_json(tmp_data.data[0], client=client)
+        return cls.from_json(tmp_data.data[0], client=client, trusted=True)
 
     @classmethod
-    def from_json(cls, data: Dict[str, Any], client: "FractalClient" = None) -> "Collection":
+    def from_json(cls, data: Dict[str, Any], client: "FractalClient" = None, trusted: bool = False) -> "Collection":
         """Creates a new class from a JSON blob
 
         Parameters
@@ -156,6 +274,9 @@ class Collection(abc.ABC):
             The JSON blob to create a new class from.
         client : FractalClient, optional
             A FractalClient connected to a server
+        trusted : bool, optional
+            The data was already validated (it came from the server), so validation is skipped
+            for fields that need no conversion
 
         Returns
         -------
@@ -177,12 +298,13 @@ class Collection(abc.ABC):
 
         name = data.pop("name")
         # Allow PyDantic to handle type validation
-        ret = cls(name, client=client, **data)
+        ret = cls(name, client=client, _trusted=trusted, **data)
         return ret
 
     def to_json(self, filename: Optional[str] = None):
         """
         If a filename is provided, dumps the file to disk. Otherwise returns a copy of the current data.
+        The copy is of the containers (dicts, lists, sets); leaf objects such as numpy arrays are shared.
 
         Parameters
         ----------
@@ -196,10 +318,12 @@ class Collection(abc.ABC):
         """
         data = self.data.dict()
         if filename is not None:
+            # The qcelemental serializer handles the sets and numpy arrays the models hold, and keeps NaN
             with open(filename, "w") as open_file:
-                json.dump(data, open_file)
+                open_file.write(serialize(data, "json"))
         else:
-            return copy.deepcopy(data)
+            # dict() already builds new containers all the way down, no need to deepcopy them again
+            return data
 
     @abc.abstractmethod
     def _pre_save_prep(self, client: "FractalClient"):
@@ -244,12 +368,12 @@ class Collection(abc.ABC):
 
         # Add the database
         if self.data.id == self.data.__fields__["id"].default:
-            response = client.add_collection(self.data.dict(), overwrite=False, full_return=True)
+            response = client.add_collection(self.data.dict(), overwrite=False, full_return=True, trusted=True)
             if response.meta.success is False:
                 raise KeyError(f"Error adding collection: \n{response.meta.error_description}")
             self.data.__dict__["id"] = response.data
         else:
-            response = client.add_collection(self.data.dict(), overwrite=True, full_return=True)
+            response = client.add_collection(self.data.dict(), overwrite=True, full_return=True, trusted=True)
             if response.meta.success is False:
                 raise KeyError(f"Error updating collection: \n{response.meta.error_description}")
 
@@ -260,18 +384,13 @@ class Collection(abc.ABC):
     @staticmethod
     def _add_molecules_by_dict(client, molecules):
 
-        flat_map_keys = []
-        flat_map_mols = []
-        for k, v in molecules.items():
-            flat_map_keys.append(k)
-            flat_map_mols.append(v)
+        flat_map_keys = list(molecules)
+        flat_map_mols = list(molecules.values())
 
-        CHUNK_SIZE = client.query_limit
-        mol_ret = []
-        for i in range(0, len(flat_map_mols), CHUNK_SIZE):
-            mol_ret.extend(client.add_molecules(flat_map_mols[i : i + CHUNK_SIZE]))
+        # Molecules are keyed by hash so no two chunks hold the same molecule, they can be uploaded concurrently
+        mol_ret = _chunked_requests(client.add_molecules, flat_map_mols, client.query_limit, max_workers=4)
 
-        return {k: v for k, v in zip(flat_map_keys, mol_ret)}
+        return dict(zip(flat_map_keys, mol_ret))
 
 
 class BaseProcedureDataset(Collection):
@@ -283,6 +402,10 @@ class BaseProcedureDataset(Collection):
 
         self.df = pd.DataFrame(index=self._get_index())
 
+        # Nesting depth of deferred_save blocks and whether a save was skipped inside them
+        self._defer_save = 0
+        self._save_pending = False
+
     class DataModel(Collection.DataModel):
 
         records: Dict[str, Any] = {}
@@ -296,9 +419,48 @@ class BaseProcedureDataset(Collection):
     def _internal_compute_add(self, spec: Any, entry: Any, tag: str, priority: str) -> "ObjectId":
         pass
 
+    def _internal_compute_add_many(self, spec: Any, entries: List[Any], tag: str, priority: str) -> List["ObjectId"]:
+        """
+        Submits a specification for many entries, returning the ids in the same order as the entries.
+
+        Subclasses which can submit in bulk should override this; by default each entry is
+        submitted on its own.
+        """
+        return [self._internal_compute_add(spec, entry, tag, priority) for entry in entries]
+
     def _pre_save_prep(self, client: "FractalClient") -> None:
         pass
 
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """
+        Postpones the saves triggered by adding specifications and entries until the block exits,
+        so that the collection is uploaded once rather than after every addition. Blocks may be nested,
+        the save happens when the outermost block exits without an exception.
+
+        Examples
+        --------
+
+        >>> with ds.deferred_save():
+        ...     for name, mol in molecules.items():
+        ...         ds.add_entry(name, mol)
+        """
+        self._defer_save += 1
+        try:
+            yield
+        finally:
+            self._defer_save -= 1
+
+        if (self._defer_save == 0) and self._save_pending:
+            self._save_pending = False
+            self.save()
+
+    def _save_or_defer(self) -> None:
+        if self._defer_save:
+            self._save_pending = True
+        else:
+            self.save()
+
     def _get_index(self):
 
         return [x.name for x in self.data.records.values()]
@@ -321,7 +483,7 @@ class BaseProcedureDataset(Collection):
             raise KeyError(f"{self.__class__.__name__} '{name}' already present, use `overwrite=True` to replace.")
 
         self.data.specs[lname] = spec
-        self.save()
+        self._save_or_defer()
 
     def _get_procedure_ids(self, spec: str, sieve: Optional[List[str]] = None) -> Dict[str, "ObjectId"]:
         """Aquires the
@@ -341,18 +503,18 @@ class BaseProcedureDataset(Collection):
 
         """
 
-        spec = self.get_specification(spec)
+        spec_name = self._get_specification(spec).name
+        if sieve:
+            sieve = set(sieve)
 
         mapper = {}
         for rec in self.data.records.values():
             if sieve and rec.name not in sieve:
                 continue
 
-            try:
-                td_id = rec.object_map[spec.name]
+            td_id = rec.object_map.get(spec_name)
+            if td_id is not None:
                 mapper[rec.name] = td_id
-            except KeyError:
-                pass
 
         return mapper
 
@@ -368,9 +530,15 @@ class BaseProcedureDataset(Collection):
         Specification
             The requested specification.
 
+        """
+        return self._get_specification(name).copy()
+
+    def _get_specification(self, name: str) -> Any:
+        """
+        Returns the stored specification itself rather than a copy, for internal use where it is not modified.
         """
         try:
-            return self.data.specs[name.lower()].copy()
+            return self.data.specs[name.lower()]
         except KeyError:
             raise KeyError(f"Specification '{name}' not found.")
 
@@ -411,7 +579,7 @@ class BaseProcedureDataset(Collection):
         self._check_entry_exists(name)
         self.data.records[name.lower()] = record
         if save:
-            self.save()
+            self._save_or_defer()
 
     def get_entry(self, name: str) -> Any:
         """Obtains a record from the Dataset
@@ -447,7 +615,7 @@ class BaseProcedureDataset(Collection):
             The requested Record
 
         """
-        spec = self.get_specification(specification)
+        spec = self._get_specification(specification)
         rec_id = self.get_entry(name).object_map.get(spec.name, None)
 
         if rec_id is None:
@@ -478,20 +646,24 @@ class BaseProcedureDataset(Collection):
         """
 
         specification = specification.lower()
-        spec = self.get_specification(specification)
+        spec = self._get_specification(specification)
+        spec_name = spec.name
         if subset:
             subset = set(subset)
 
-        submitted = 0
-        for entry in self.data.records.values():
-            if (subset is not None) and (entry.name not in subset):
-                continue
+        pending = [
+            entry
+            for entry in self.data.records.values()
+            if ((subset is None) or (entry.name in subset)) and (spec_name not in entry.object_map)
+        ]
 
-            if spec.name in entry.object_map:
-                continue
+        # Submit all of the new computations together rather than one request per entry
+        if pending:
+            ids = self._internal_compute_add_many(spec, pending, tag, priority)
+            for entry, oid in zip(pending, ids):
+                entry.object_map[spec_name] = oid
 
-            entry.object_map[spec.name] = self._internal_compute_add(spec, entry, tag, priority)
-            submitted += 1
+        submitted = len(pending)
 
         self.data.history.add(specification)
 
@@ -501,7 +673,7 @@ class BaseProcedureDataset(Collection):
 
         return submitted
 
-    def query(self, specification: str, force: bool = False) -> pd.Series:
+    def query(self, specification: str, force: bool = False, max_workers: int = 4) -> pd.Series:
         """Queries a given specification from the server
 
         Parameters
@@ -510,6 +682,8 @@ class BaseProcedureDataset(Collection):
             The specification name to query
         force : bool, optional
             Force a fresh query if the specification already exists.
+        max_workers : int, optional
+            The maximum number of chunks of procedures requested from the server at once.
 
         Returns
         -------
@@ -517,35 +691,68 @@ class BaseProcedureDataset(Collection):
             Records collected from the server
         """
         # Try to get the specification, will throw if not found.
-        spec = self.get_specification(specification)
+        spec = self._get_specification(specification)
 
         if not force and (spec.name in self.df):
             return spec.name
 
-        mapper = self._get_procedure_ids(spec.name)
-        query_ids = list(mapper.values())
+        data = self._fetch_specification(spec.name, max_workers=max_workers)
+        self.df[spec.name] = data
 
-        # Chunk up the queries
-        procedures: List[Dict[str, Any]] = []
-        for i in range(0, len(query_ids), self.client.query_limit):
-            chunk_ids = query_ids[i : i + self.client.query_limit]
-            procedures.extend(self.client.query_procedures(id=chunk_ids))
+        return data
 
-        proc_lookup = {x.id: x for x in procedures}
+    def _query_many(self, specifications: List[str], force: bool = False, max_workers: int = 4) -> List[str]:
+        """Queries several specifications from the server, fetching them concurrently
 
-        data = []
-        for name, oid in mapper.items():
-            try:
-                data.append([name, proc_lookup[oid]])
-            except KeyError:
-                data.append([name, None])
+        Parameters
+        ----------
+        specifications : List[str]
+            The specification names to query
+        force : bool, optional
+            Force a fresh query of specifications which already exist.
+        max_workers : int, optional
+            The maximum number of specifications requested from the server at once.
+
+        Returns
+        -------
+        List[str]
+            The names of the specifications, as they appear in the columns of ``self.df``
+        """
+        names = [self._get_specification(x).name for x in specifications]
+        missing = [x for x in dict.fromkeys(names) if force or (x not in self.df)]
+
+        if max_workers > 1 and len(missing) > 1:
+            # Each specification gets a single worker so that no more than max_workers requests are made at once
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                columns = list(executor.map(lambda x: self._fetch_specification(x, max_workers=1), missing))
+        else:
+            columns = [self._fetch_specification(x, max_workers=max_workers) for x in missing]
+
+        # The DataFrame is only modified from this thread
+        for name, data in zip(missing, columns):
+            self.df[name] = data
+
+        return names
 
-        df = pd.DataFrame(data, columns=["index", spec.name])
-        df.set_index("index", inplace=True)
+    def _fetch_specification(self, name: str, max_workers: int) -> pd.Series:
+        """Pulls the records of a specification, given by its stored name, without storing them in ``self.df``"""
+        mapper = self._get_procedure_ids(name)
+        query_ids = list(mapper.values())
 
-        self.df[spec.name] = df[spec.name]
+        # Chunk up the queries
+        procedures = _chunked_requests(
+            lambda chunk_ids: self.client.query_procedures(id=chunk_ids),
+            query_ids,
+            self.client.query_limit,
+            max_workers=max_workers,
+        )
 
-        return df[spec.name]
+        proc_lookup = {x.id: x for x in procedures}
+
+        # Build the column directly, there is no need for an intermediate DataFrame
+        index = pd.Index(list(mapper.keys()), name="index")
+        values = [proc_lookup.get(oid) for oid in mapper.values()]
+        return pd.Series(values, index=index, dtype=object, name=name)
 
     def status(
         self,
@@ -583,26 +790,37 @@ class BaseProcedureDataset(Collection):
 
             # Query all of the specs and make sure they are valid
             # Specs may not be loaded to self.df yet. This can be accomplished
-            #     with self.query, which stores the info in self.df
-            for spec in specs:
-                self.query(spec)
+            #     with self._query_many, which stores the info in self.df
+            specs = self._query_many(specs)
+
+            # One pass over all of the cells rather than a pandas apply per column and row.
+            # Cells without a record (NaN) have no status
+            records = self.df[specs]
+            cells = records.to_numpy(dtype=object).ravel()
+            statuses = [getattr(x, "status", None) for x in cells]
+            statuses = np.array([None if x is None else x.value for x in statuses], dtype=object)
+            statuses = statuses.reshape(records.shape)
 
-            def get_status(item):
-                try:
-                    return item.status.value
-                except AttributeError:
-                    return None
+            if collapse:
+                # Count each column directly instead of building the full table first
+                counts = {}
+                for col, col_statuses in zip(records.columns, statuses.T):
+                    col_counts = Counter(x for x in col_statuses if x is not None)
+                    if status:
+                        col_counts = Counter({k: v for k, v in col_counts.items() if k == status.upper()})
+                    counts[col] = pd.Series(dict(col_counts.most_common()), dtype=np.int64)
+
+                df = pd.DataFrame(counts)
+                if len(counts) > 1:
+                    df.sort_index(inplace=True)
+                return df
 
-            # apply status by column then by row
-            df = self.df[specs].apply(lambda col: col.apply(get_status))
+            df = pd.DataFrame(statuses, index=records.index, columns=records.columns)
 
             if status:
-                df = df[(df == status.upper())]
+                df = df.where(statuses == status.upper())
 
-            if collapse:
-                return df.apply(lambda x: x.value_counts())
-            else:
-                return df
+            return df
 
         if status not in [None, "INCOMPLETE"]:
             raise KeyError("Detailed status is only available for incomplete procedures.")
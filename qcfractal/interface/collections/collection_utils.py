@@ -43,7 +43,7 @@ def register_collection(collection: "Collection") -> None:
     __registered_collections[class_name] = collection
 
 
-def collection_factory(data: Dict[str, Any], client: "FractalClient" = None) -> "Collection":
+def collection_factory(data: Dict[str, Any], client: "FractalClient" = None, trusted: bool = False) -> "Collection":
     """Creates a new Collection class from a JSON blob.
 
     Parameters
@@ -52,6 +52,8 @@ def collection_factory(data: Dict[str, Any], client: "FractalClient" = None) ->
         The JSON blob to create a new class from.
     client : FractalClient, optional
         A FractalClient connected to a server
+    trusted : bool, optional
+        The data came from the server and was already validated
 
     Returns
     -------
@@ -65,7 +67,7 @@ def collection_factory(data: Dict[str, Any], client: "FractalClient" = None) ->
     if data["collection"].lower() not in __registered_collections:
         raise KeyError("Attempted to create Collection of unknown type '{}'.".format(data["collection"]))
 
-    return __registered_collections[data["collection"].lower()].from_json(data, client=client)
+    return __registered_collections[data["collection"].lower()].from_json(data, client=client, trusted=trusted)
 
 
 def collections_name_map() -> Dict[str, str]:
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from ..models import GridOptimizationInput, ObjectId, OptimizationSpecification, ProtoModel, QCSpecification
 from ..models.gridoptimization import GOKeywords
-from .collection import BaseProcedureDataset
+from .collection import BaseProcedureDataset, _chunked_requests
 from .collection_utils import register_collection
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -41,15 +41,25 @@ class GridOptimizationDataset(BaseProcedureDataset):
             pass
 
     def _internal_compute_add(self, spec: Any, entry: Any, tag: str, priority: str) -> ObjectId:
-        service = GridOptimizationInput(
-            initial_molecule=entry.initial_molecule,
-            keywords=entry.go_keywords,
-            optimization_spec=spec.optimization_spec,
-            qc_spec=spec.qc_spec,
+        return self._internal_compute_add_many(spec, [entry], tag, priority)[0]
+
+    def _internal_compute_add_many(self, spec: Any, entries: List[GOEntry], tag: str, priority: str) -> List[ObjectId]:
+        services = [
+            GridOptimizationInput(
+                initial_molecule=entry.initial_molecule,
+                keywords=entry.go_keywords,
+                optimization_spec=spec.optimization_spec,
+                qc_spec=spec.qc_spec,
+            )
+            for entry in entries
+        ]
+
+        return _chunked_requests(
+            lambda chunk: self.client.add_service(chunk, tag=tag, priority=priority).ids,
+            services,
+            self.client.query_limit,
         )
 
-        return self.client.add_service([service], tag=tag, priority=priority).ids[0]
-
     def add_specification(
         self,
         name: str,
@@ -1,13 +1,13 @@
 """
 QCPortal Database ODM
 """
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 import qcelemental as qcel
 
 from ..models import ObjectId, OptimizationSpecification, ProtoModel, QCSpecification
-from .collection import BaseProcedureDataset
+from .collection import BaseProcedureDataset, _chunked_requests
 from .collection_utils import register_collection
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -44,26 +44,56 @@ class OptimizationDataset(BaseProcedureDataset):
 
     def _internal_compute_add(self, spec: Any, entry: Any, tag: str, priority: str) -> ObjectId:
 
+        return self._internal_compute_add_many(spec, [entry], tag, priority)[0]
+
+    def _internal_compute_add_many(self, spec: Any, entries: List[OptEntry], tag: str, priority: str) -> List[ObjectId]:
+
         # Form per-procedure keywords dictionary
         general_keywords = spec.optimization_spec.keywords
         if general_keywords is None:
             general_keywords = {}
-        keywords = {**general_keywords, **entry.additional_keywords}
-
-        procedure_parameters = {
-            "keywords": keywords,
-            "qc_spec": spec.qc_spec.dict(),
-            "protocols": spec.protocols.dict(),
-        }
-
-        return self.client.add_procedure(
-            "optimization",
-            spec.optimization_spec.program,
-            procedure_parameters,
-            [entry.initial_molecule],
-            tag=tag,
-            priority=priority,
-        ).ids[0]
+
+        # Entries with the same keywords are submitted together, as one procedure over all of
+        # their molecules. Nearly all entries share their keywords, so there are few groups
+        groups: List[Tuple[Dict[str, Any], List[int]]] = []
+        for i, entry in enumerate(entries):
+            keywords = {**general_keywords, **entry.additional_keywords}
+            for group_keywords, indices in groups:
+                if group_keywords == keywords:
+                    indices.append(i)
+                    break
+            else:
+                groups.append((keywords, [i]))
+
+        ids = [None] * len(entries)
+        for keywords, indices in groups:
+            procedure_parameters = {
+                "keywords": keywords,
+                "qc_spec": spec.qc_spec.dict(),
+                "protocols": spec.protocols.dict(),
+            }
+
+            # The server returns no id for a molecule repeated within one request, so each
+            # molecule is sent once and its id shared by all of its entries
+            molecules = list(dict.fromkeys(entries[i].initial_molecule for i in indices))
+            molecule_ids = _chunked_requests(
+                lambda chunk: self.client.add_procedure(
+                    "optimization",
+                    spec.optimization_spec.program,
+                    procedure_parameters,
+                    chunk,
+                    tag=tag,
+                    priority=priority,
+                ).ids,
+                molecules,
+                self.client.query_limit,
+            )
+            molecule_ids = dict(zip(molecules, molecule_ids))
+
+            for i in indices:
+                ids[i] = molecule_ids[entries[i].initial_molecule]
+
+        return ids
 
     def add_specification(
         self,
@@ -174,12 +204,8 @@ class OptimizationDataset(BaseProcedureDataset):
         if specs is None:
             specs = list(self.df.columns)
         else:
-            new_specs = []
-            for spec in specs:
-                new_specs.append(self.query(spec))
-
             # Remap names
-            specs = new_specs
+            specs = self._query_many(specs)
 
         def count_gradients(opt):
             if (not hasattr(opt, "status")) or opt.status != "COMPLETE":
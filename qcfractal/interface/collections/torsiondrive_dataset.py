@@ -8,7 +8,7 @@ import pandas as pd
 from ..models import ObjectId, OptimizationSpecification, ProtoModel, QCSpecification, TorsionDriveInput
 from ..models.torsiondrive import TDKeywords
 from ..visualization import custom_plot
-from .collection import BaseProcedureDataset
+from .collection import BaseProcedureDataset, _chunked_requests
 from .collection_utils import register_collection
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -44,14 +44,25 @@ class TorsionDriveDataset(BaseProcedureDataset):
 
     def _internal_compute_add(self, spec: Any, entry: Any, tag: str, priority: str) -> ObjectId:
 
-        service = TorsionDriveInput(
-            initial_molecule=entry.initial_molecules,
-            keywords=entry.td_keywords,
-            optimization_spec=spec.optimization_spec,
-            qc_spec=spec.qc_spec,
-        )
+        return self._internal_compute_add_many(spec, [entry], tag, priority)[0]
+
+    def _internal_compute_add_many(self, spec: Any, entries: List[TDEntry], tag: str, priority: str) -> List[ObjectId]:
 
-        return self.client.add_service([service], tag=tag, priority=priority).ids[0]
+        services = [
+            TorsionDriveInput(
+                initial_molecule=entry.initial_molecules,
+                keywords=entry.td_keywords,
+                optimization_spec=spec.optimization_spec,
+                qc_spec=spec.qc_spec,
+            )
+            for entry in entries
+        ]
+
+        return _chunked_requests(
+            lambda chunk: self.client.add_service(chunk, tag=tag, priority=priority).ids,
+            services,
+            self.client.query_limit,
+        )
 
     def add_specification(
         self,
@@ -179,12 +190,8 @@ class TorsionDriveDataset(BaseProcedureDataset):
         if specs is None:
             specs = list(self.df.columns)
         else:
-            new_specs = []
-            for spec in specs:
-                new_specs.append(self.query(spec))
-
             # Remap names
-            specs = new_specs
+            specs = self._query_many(specs)
 
         # Count functions
         def count_gradient_evals(td):
@@ -265,9 +272,7 @@ class TorsionDriveDataset(BaseProcedureDataset):
             entries = [entries]
 
         # Query all of the specs and make sure they are valid
-        formatted_spec_names = []
-        for spec in specs:
-            formatted_spec_names.append(self.query(spec))
+        formatted_spec_names = self._query_many(specs)
 
         traces = []
         ranges = []
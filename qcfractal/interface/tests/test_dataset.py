@@ -2,7 +2,12 @@
 Tests the QCPortal dataset object
 """
 
+import copy
+import json
+
+import numpy as np
 import pytest
+from qcelemental.util import deserialize, serialize
 
 from . import portal
 from . import test_helper as th
@@ -241,3 +246,72 @@ def test_database_history():
     assert ds.list_records(program="P1").shape[0] == 4
     assert ds.list_records(basis="None").shape[0] == 3
     assert ds.list_records(keywords="None").shape[0] == 1
+
+
+def test_dataset_to_json_copy():
+    ds = portal.collections.Dataset("json_copy_test")
+    ds.data.metadata["nested"] = {"values": [1]}
+
+    data = ds.to_json()
+    data["metadata"]["nested"]["values"].append(2)
+
+    assert ds.data.metadata["nested"]["values"] == [1]
+
+
+def test_dataset_to_json_file(tmp_path):
+    ds = portal.collections.Dataset("json_test")
+    ds._add_history(driver="energy", program="p1", method="m1", basis="b1", keywords=None)
+
+    filename = str(tmp_path / "ds.json")
+    ds.to_json(filename)
+
+    with open(filename, "rb") as handle:
+        data = json.loads(handle.read())
+
+    assert data["name"] == "json_test"
+    assert len(data["history"]) == 1
+
+    ds2 = portal.collections.Dataset.from_json(data)
+    assert ds2.list_records().shape[0] == 1
+
+
+def test_dataset_to_json_file_contributed_values(tmp_path):
+    records = [{"name": "He1", "molecule_id": "1"}, {"name": "He2", "molecule_id": "2"}]
+    ds = portal.collections.Dataset.from_json({"collection": "dataset", "name": "json_test", "records": records})
+    ds.add_contributed_values(
+        {
+            "name": "Energy",
+            "theory_level": "pseudo-random values",
+            "values": [0.5, np.nan],
+            "index": ["He1", "He2"],
+            "theory_level_details": {"driver": "energy"},
+            "units": "hartree",
+        }
+    )
+
+    filename = str(tmp_path / "ds.json")
+    ds.to_json(filename)
+
+    with open(filename, "r") as handle:
+        data = json.load(handle)
+
+    # Missing values stay NaN rather than becoming null
+    assert data["contributed_values"]["energy"]["index"] == ["He1", "He2"]
+    assert data["contributed_values"]["energy"]["values"][0] == 0.5
+    assert np.isnan(data["contributed_values"]["energy"]["values"][1])
+
+    contributed = portal.collections.Dataset.from_json(data).data.contributed_values["energy"]
+    assert contributed.values.dtype == np.float64
+    assert np.isnan(contributed.values[1])
+
+
+def test_dataset_from_json_trusted(water_ds):
+    # Data as the server sends it back
+    data = deserialize(serialize(water_ds.to_json(), "msgpack-ext"), "msgpack-ext")
+
+    validated = portal.collections.ReactionDataset.from_json(copy.deepcopy(data))
+    trusted = portal.collections.ReactionDataset.from_json(copy.deepcopy(data), trusted=True)
+
+    assert trusted.data == validated.data
+    assert trusted.data.ds_type == validated.data.ds_type
+    assert isinstance(trusted.data.history, set)
@@ -6,9 +6,20 @@ import abc
 import importlib
 import logging
 import operator
+from functools import lru_cache
 from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 
+@lru_cache(maxsize=4096)
+def _resolve_function(function: str) -> Callable:
+    """Imports the module and looks up the (possibly nested) attribute of a full function path"""
+
+    module_name, _, func_name = function.partition(".")
+    module = importlib.import_module(module_name)
+
+    return operator.attrgetter(func_name)(module) if func_name else module
+
+
 class BaseAdapter(abc.ABC):
     """A BaseAdapter for wrapping compute engines"""
 
@@ -62,7 +73,6 @@ class BaseAdapter(abc.ABC):
         self.logger = logger or logging.getLogger(self.__class__.__name__)
 
         self.queue = {}
-        self.function_map = {}
         self.cores_per_task = cores_per_task
         self.memory_per_task = memory_per_task
         self.nodes_per_task = nodes_per_task
@@ -95,14 +105,8 @@ class BaseAdapter(abc.ABC):
         >>> get_function("numpy.einsum")
         <function einsum at 0x110406a60>
         """
-        if function in self.function_map:
-            return self.function_map[function]
-
-        module_name, func_name = function.split(".", 1)
-        module = importlib.import_module(module_name)
-        self.function_map[function] = operator.attrgetter(func_name)(module)
-
-        return self.function_map[function]
+        # Cached across adapters, a function path always resolves to the same object
+        return _resolve_function(function)
 
     @property
     def qcengine_local_options(self) -> Dict[str, Any]:
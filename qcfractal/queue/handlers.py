@@ -393,7 +393,8 @@ class QueueManagerHandler(APIHandler):
             ret = {"nshutdown": nshutdown}
 
         elif op == "heartbeat":
-            self.storage.manager_update(name, status="ACTIVE", **body.meta.dict(), log=True)
+            # Heartbeats are frequent, so don't wait on a concurrent update of the same manager
+            self.storage.manager_update(name, status="ACTIVE", **body.meta.dict(), log=True, skip_locked=True)
             self.logger.debug("QueueManager: Heartbeat of manager {} detected.".format(name))
 
         else:
@@ -588,16 +588,11 @@ class FractalServer:
         """
 
         dt = datetime.datetime.utcnow() - datetime.timedelta(seconds=self.heartbeat_frequency)
-        ret = self.storage.get_managers(status="ACTIVE", modified_before=dt)
-
-        for blob in ret["data"]:
-            nshutdown = self.storage.queue_reset_status(manager=blob["name"], reset_running=True)
-            self.storage.manager_update(blob["name"], returned=nshutdown, status="INACTIVE")
+        deactivated = self.storage.deactivate_managers(modified_before=dt)
 
+        for name, nshutdown in deactivated.items():
             self.logger.info(
-                "Hearbeat missing from {}. Shutting down, recycling {} incomplete tasks.".format(
-                    blob["name"], nshutdown
-                )
+                "Hearbeat missing from {}. Shutting down, recycling {} incomplete tasks.".format(name, nshutdown)
             )
 
     def list_managers(self, status: Optional[str] = None, name: Optional[str] = None) -> List[Dict[str, Any]]:
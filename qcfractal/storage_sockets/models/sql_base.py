@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from qcelemental.util import msgpackext_dumps, msgpackext_loads
 from sqlalchemy import and_, inspect
 from sqlalchemy.dialects.postgresql import BYTEA
@@ -64,6 +66,7 @@ class Base:
         return ret
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _get_fieldnames_with_DB_ids_(cls):
 
         class_inspector = inspect(cls)
@@ -76,21 +79,20 @@ class Base:
         return id_fields
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _get_col_types(cls):
 
-        # Must use private attributes so that they are not shared by subclasses
-        if hasattr(cls, "__columns") and hasattr(cls, "__hybrids") and hasattr(cls, "__relationships"):
-            return cls.__columns, cls.__hybrids, cls.__relationships
-
+        # Cached per class (lru_cache is keyed on cls), so subclasses don't share the results.
+        # The mapper does not change at runtime, so this only needs to be inspected once
         mapper = inspect(cls)
 
-        cls.__columns = []
-        cls.__hybrids = []
-        cls.__relationships = {}
+        columns = []
+        hybrids = []
+        relationships = {}
         for k, v in mapper.relationships.items():
-            cls.__relationships[k] = {}
-            cls.__relationships[k]["join_class"] = v.argument
-            cls.__relationships[k]["remote_side_column"] = list(v.remote_side)[0]
+            relationships[k] = {}
+            relationships[k]["join_class"] = v.argument
+            relationships[k]["remote_side_column"] = list(v.remote_side)[0]
 
         for k, c in mapper.all_orm_descriptors.items():
 
@@ -101,11 +103,11 @@ class Base:
                 continue
 
             if c.extension_type == HYBRID_PROPERTY:
-                cls.__hybrids.append(k)
+                hybrids.append(k)
             elif k not in mapper.relationships:
-                cls.__columns.append(k)
+                columns.append(k)
 
-        return cls.__columns, cls.__hybrids, cls.__relationships
+        return columns, hybrids, relationships
 
     @classmethod
     def _all_col_names(cls):
@@ -338,4 +338,9 @@ class QueueManagerORM(Base):
     programs = Column(JSON)
     procedures = Column(JSON)
 
-    __table_args__ = (Index("ix_queue_manager_status", "status"), Index("ix_queue_manager_modified_on", "modified_on"))
+    __table_args__ = (
+        Index("ix_queue_manager_status", "status"),
+        Index("ix_queue_manager_modified_on", "modified_on"),
+        # For the heartbeat check, which only looks at active managers
+        Index("ix_queue_manager_active_modified_on", "modified_on", postgresql_where=text("status = 'active'")),
+    )
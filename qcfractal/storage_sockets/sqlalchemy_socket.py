@@ -3,11 +3,13 @@ SQLAlchemy Database class to handle access to Pstgres through ORM
 """
 
 try:
-    from sqlalchemy import create_engine, and_, or_, case, func
+    from sqlalchemy import create_engine, and_, any_, bindparam, or_, case, func, String
+    from sqlalchemy.dialects.postgresql import ARRAY
+    from sqlalchemy.dialects.postgresql import insert as postgres_insert
     from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.ext import baked
     from sqlalchemy.orm import sessionmaker, with_polymorphic
-    from sqlalchemy.sql.expression import desc
-    from sqlalchemy.sql.expression import case as expression_case
+    from sqlalchemy.sql.expression import desc, literal, select
 except ImportError:
     raise ImportError(
         "SQLAlchemy_socket requires sqlalchemy, please install this python " "module or try a different db_socket."
@@ -27,6 +29,7 @@ import bcrypt
 from qcfractal.interface.models import (
     GridOptimizationRecord,
     KeywordSet,
+    ManagerStatusEnum,
     Molecule,
     ObjectId,
     OptimizationRecord,
@@ -43,6 +46,7 @@ from qcfractal.interface.models.records import RecordStatusEnum
 from qcfractal.storage_sockets.db_queries import QUERY_CLASSES
 from qcfractal.storage_sockets.models import (
     AccessLogORM,
+    Base,
     BaseResultORM,
     CollectionORM,
     DatasetORM,
@@ -65,14 +69,27 @@ from qcfractal.storage_sockets.models import (
 )
 from qcfractal.storage_sockets.storage_utils import add_metadata_template, get_metadata_template
 
-from .models import Base
-
 if TYPE_CHECKING:
     from ..services.service_util import BaseService
 
 # for version checking
 import qcelemental, qcfractal, qcengine
 
+# Cache of compiled queries for the hot paths (see sqlalchemy.ext.baked)
+_bakery = baked.bakery()
+
+# Manager stats copied into each QueueManagerLogORM snapshot
+_manager_log_stats = (
+    "completed",
+    "submitted",
+    "failures",
+    "total_worker_walltime",
+    "total_task_walltime",
+    "active_tasks",
+    "active_cores",
+    "active_memory",
+)
+
 _null_keys = {"basis", "keywords"}
 _id_keys = {"id", "molecule", "keywords", "procedure_id"}
 _lower_func = lambda x: x.lower()
@@ -129,6 +146,33 @@ def get_count_fast(query):
     return count
 
 
+def get_page_count(query, n_page: int, limit: int, skip: int) -> int:
+    """
+    returns total count of the query, given a page of n_page rows read with limit/skip
+
+    A page that is not full ends the result set, so the count is skip + n_page and
+    no COUNT query is needed. Only a full page (or an empty page past the end)
+    falls back to get_count_fast. A limit of 0 reads no rows at all and is used to
+    get the count alone, so it is always counted.
+    """
+
+    if limit > 0 and (0 < n_page < limit or (n_page == 0 and skip == 0)):
+        return skip + n_page
+
+    return get_count_fast(query)
+
+
+def _manager_count(session, name: str) -> int:
+    """
+    Number of managers with the given name (0 or 1), without taking any lock
+    """
+
+    count = _bakery(lambda s: s.query(func.count(QueueManagerORM.id)))
+    count += lambda q: q.filter(QueueManagerORM.name == bindparam("name"))
+
+    return count(session).params(name=name).scalar()
+
+
 def get_procedure_class(record):
 
     if isinstance(record, OptimizationRecord):
@@ -381,9 +425,9 @@ class SQLAlchemySocket:
                 # query with projection, without joins
                 data = session.query(*proj).filter(*query)
 
-                n_found = get_count_fast(data)  # before iterating on the data
-                data = data.limit(self.get_limit(limit)).offset(skip)
-                rdata = [dict(zip(_projection, row)) for row in data]
+                limit = self.get_limit(limit)
+                rdata = [dict(zip(_projection, row)) for row in data.limit(limit).offset(skip)]
+                n_found = get_page_count(data, len(rdata), limit, skip)
 
                 # query for joins if any (relationships and hybrids)
                 if join_attrs:
@@ -437,9 +481,9 @@ class SQLAlchemySocket:
 
                 # from sqlalchemy.dialects import postgresql
                 # print(data.statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
-                n_found = get_count_fast(data)
-                data = data.limit(self.get_limit(limit)).offset(skip).all()
-                rdata = [d.to_dict() for d in data]
+                limit = self.get_limit(limit)
+                rdata = [d.to_dict() for d in data.limit(limit).offset(skip)]
+                n_found = get_page_count(data, len(rdata), limit, skip)
 
         return rdata, n_found
 
@@ -1472,8 +1516,9 @@ class SQLAlchemySocket:
                 .filter(BaseResultORM.id == TaskQueueORM.base_result_id)
                 .filter(TaskQueueORM.id.in_(task_id_list))
             )
-            meta["n_found"] = get_count_fast(data)
+            # Not paged, so the count is just the number of rows
             data = [d.to_dict() for d in data.all()]
+            meta["n_found"] = len(data)
             meta["success"] = True
             # except Exception as err:
             #     meta['error_description'] = str(err)
@@ -2149,13 +2194,20 @@ class SQLAlchemySocket:
         waiting tasks to run.
         """
 
-        proc_filt = TaskQueueORM.procedure.in_([p.lower() for p in available_procedures])
+        # Lower and dedupe in a single pass
+        available_programs = list(dict.fromkeys(p.lower() for p in available_programs))
+        available_procedures = list(dict.fromkeys(p.lower() for p in available_procedures))
+
+        proc_filt = TaskQueueORM.procedure.in_(available_procedures)
         none_filt = TaskQueueORM.procedure == None  # lgtm [py/test-equals-none]
 
         order_by = []
         if tag is not None:
             if isinstance(tag, str):
                 tag = [tag]
+            else:
+                # Each tag is a separate query, so don't run repeated tags twice. Order is kept
+                tag = list(dict.fromkeys(tag))
 
         order_by.extend([TaskQueueORM.priority.desc(), TaskQueueORM.created_on])
         queries = []
@@ -2655,6 +2707,7 @@ class SQLAlchemySocket:
     def manager_update(self, name, **kwargs):
 
         do_log = kwargs.pop("log", False)
+        skip_locked = kwargs.pop("skip_locked", False)
 
         inc_count = {
             # Increment relevant data
@@ -2666,37 +2719,55 @@ class SQLAlchemySocket:
 
         upd = {key: kwargs[key] for key in QueueManagerORM.__dict__.keys() if key in kwargs}
 
+        table = QueueManagerORM.__table__
+        values = dict(upd, **inc_count, modified_on=dt.utcnow())
+
+        # Update the existing manager straight away, the UPDATE takes the row lock itself so
+        # there is no separate locked lookup. With skip_locked, the row is picked by a
+        # FOR UPDATE SKIP LOCKED subquery, so a row held by a concurrent update of the same
+        # manager is skipped instead of waiting on the lock
+        if skip_locked:
+            locked = select([table.c.id]).where(table.c.name == name).with_for_update(skip_locked=True)
+            update_stmt = table.update().where(table.c.id == locked.as_scalar()).values(values)
+        else:
+            update_stmt = table.update().where(table.c.name == name).values(values)
+
         with self.session_scope() as session:
-            # QueueManagerORM.objects()  # init
-            manager = session.query(QueueManagerORM).filter_by(name=name)
-            if manager.count() > 0:  # existing
-                upd.update(inc_count, modified_on=dt.utcnow())
-                num_updated = manager.update(upd)
-            else:  # create new, ensures defaults and validations
-                manager = QueueManagerORM(name=name, **upd)
-                session.add(manager)
-                session.commit()
-                num_updated = 1
+            num_updated = session.execute(update_stmt).rowcount
+
+            if num_updated == 0:
+                # Only a miss pays for the unlocked probe
+                if skip_locked and _manager_count(session, name) > 0:
+                    # Exists, but is locked by another transaction. Caller can try again later
+                    self.logger.debug(f"QUEUE: Manager {name} is locked by another update, skipping.")
+                    return False
+
+                # create new, ensures defaults and validations
+                # ON CONFLICT covers another transaction creating the same manager in the meantime
+                stmt = (
+                    postgres_insert(table)
+                    .values(name=name, **upd)
+                    .on_conflict_do_nothing(index_elements=[table.c.name])
+                    .returning(table.c.id)
+                )
+                if session.execute(stmt).scalar() is not None:
+                    num_updated = 1
+                else:  # created by someone else, update that one (waits for its lock)
+                    stmt = table.update().where(table.c.name == name).values(values)
+                    num_updated = session.execute(stmt).rowcount
 
             if do_log:
-                # Pull again in case it was updated
-                manager = session.query(QueueManagerORM).filter_by(name=name).first()
-
-                manager_log = QueueManagerLogORM(
-                    manager_id=manager.id,
-                    completed=manager.completed,
-                    submitted=manager.submitted,
-                    failures=manager.failures,
-                    total_worker_walltime=manager.total_worker_walltime,
-                    total_task_walltime=manager.total_task_walltime,
-                    active_tasks=manager.active_tasks,
-                    active_cores=manager.active_cores,
-                    active_memory=manager.active_memory,
+                # Copy the stats into the log on the server side (INSERT ... FROM SELECT), so no
+                # row, dict or ORM object is built in Python for the snapshot
+                stats = [getattr(QueueManagerORM, k) for k in _manager_log_stats]
+                snapshot = select([QueueManagerORM.id, literal(dt.utcnow())] + stats)
+                snapshot = snapshot.where(QueueManagerORM.name == name)
+                session.execute(
+                    QueueManagerLogORM.__table__.insert().from_select(
+                        ("manager_id", "timestamp") + _manager_log_stats, snapshot
+                    )
                 )
 
-                session.add(manager_log)
-                session.commit()
-
         return num_updated == 1
 
     def get_managers(
@@ -2704,15 +2775,53 @@ class SQLAlchemySocket:
     ):
 
         meta = get_metadata_template()
-        query = format_query(QueueManagerORM, name=name, status=status)
 
-        if modified_before:
-            query.append(QueueManagerORM.modified_on <= modified_before)
+        # Filters are expanding bind parameters, so each combination of filters compiles
+        # to one SQL string however many names/statuses are given. The compiled forms are
+        # kept in the bakery and only the parameter values change between calls
+        page_q = _bakery(lambda s: s.query(QueueManagerORM.__table__, func.count().over().label("n_found")))
+        count_q = _bakery(lambda s: s.query(func.count(QueueManagerORM.id)))
+        params = {"limit": self.get_limit(limit), "skip": skip}
 
+        filters = []
+        if name is not None:
+            filters.append(lambda q: q.filter(QueueManagerORM.name.in_(bindparam("name", expanding=True))))
+            params["name"] = [name] if isinstance(name, str) else list(name)
+        if status is not None:
+            filters.append(lambda q: q.filter(QueueManagerORM.status.in_(bindparam("status", expanding=True))))
+            params["status"] = [status] if isinstance(status, str) else list(status)
+        if modified_before:
+            filters.append(lambda q: q.filter(QueueManagerORM.modified_on <= bindparam("modified_before")))
+            params["modified_before"] = modified_before
         if modified_after:
-            query.append(QueueManagerORM.modified_on >= modified_after)
+            filters.append(lambda q: q.filter(QueueManagerORM.modified_on >= bindparam("modified_after")))
+            params["modified_after"] = modified_after
+
+        for f in filters:
+            page_q += f
+            count_q += f
+        page_q += lambda q: q.limit(bindparam("limit")).offset(bindparam("skip"))
+
+        # Managers only have plain columns, so read the rows straight into dicts rather
+        # than building full ORM objects just to call to_dict on them
+        with self.session_scope() as session:
+            # The total count comes along with each row (COUNT(*) OVER ()), so the
+            # filtered set is only scanned once
+            page = [row._asdict() for row in page_q(session).params(**params)]
+
+            if page:
+                meta["n_found"] = page[0]["n_found"]
+            elif skip or params["limit"] == 0:
+                # Skipped past the end or no rows requested, so there is no row to read the count from
+                meta["n_found"] = count_q(session).params(**params).scalar()
+            else:
+                meta["n_found"] = 0
+
+        data = page
+        for d in data:
+            del d["n_found"]
+            d["id"] = str(d["id"])
 
-        data, meta["n_found"] = self.get_query_projection(QueueManagerORM, query, limit=limit, skip=skip)
         meta["success"] = True
 
         return {"data": data, "meta": meta}
@@ -2731,6 +2840,97 @@ class SQLAlchemySocket:
 
         return {"data": data, "meta": meta}
 
+    def deactivate_managers(
+        self, name: Optional[List[str]] = None, modified_before: Optional[dt] = None
+    ) -> Dict[str, int]:
+        """
+        Marks active managers as inactive and returns their running tasks to the queue
+
+        All matching managers are handled at once, rather than one queue_reset_status and
+        manager_update per manager.
+
+        Parameters
+        ----------
+        name : Optional[List[str]], optional
+            Only deactivate managers with these names
+        modified_before : Optional[datetime], optional
+            Only deactivate managers last updated before this time
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of tasks returned to the queue, keyed by the name of each deactivated manager
+        """
+
+        if name is not None and len(name) == 0:
+            return {}
+
+        # Filters go into a single flat AND. Names are sent as one array parameter (= ANY)
+        # rather than one bind parameter per name
+        query = [QueueManagerORM.status == ManagerStatusEnum.active]
+        if name is not None:
+            query.append(QueueManagerORM.name == any_(bindparam("name", list(name), type_=ARRAY(String))))
+        if modified_before is not None:
+            query.append(QueueManagerORM.modified_on <= modified_before)
+
+        now = dt.utcnow()
+        manager_table = QueueManagerORM.__table__
+        task_table = TaskQueueORM.__table__
+        result_table = BaseResultORM.__table__
+
+        # Everything happens in one statement made of data-modifying CTEs, so there is no
+        # window where a manager is inactive but its tasks are still assigned to it.
+        # All CTEs see the same snapshot, so the returned count is taken from the running
+        # tasks directly rather than by updating the manager rows a second time. The SET
+        # values are anonymous literals since the three UPDATEs share column names
+        running = (
+            select([func.count()])
+            .where(and_(task_table.c.manager == manager_table.c.name, task_table.c.status == TaskStatusEnum.running))
+            .as_scalar()
+        )
+        deactivated = (
+            manager_table.update()
+            .where(and_(*query))
+            .values(
+                status=literal(ManagerStatusEnum.inactive, manager_table.c.status.type),
+                modified_on=literal(now),
+                returned=manager_table.c.returned + running,
+            )
+            .returning(manager_table.c.name)
+            .cte("deactivated")
+        )
+        reset = (
+            task_table.update()
+            .where(
+                and_(
+                    task_table.c.manager.in_(select([deactivated.c.name])),
+                    task_table.c.status == TaskStatusEnum.running,
+                )
+            )
+            .values(status=literal(TaskStatusEnum.waiting, task_table.c.status.type), modified_on=literal(now))
+            .returning(task_table.c.manager, task_table.c.base_result_id)
+            .cte("reset")
+        )
+        results = (
+            result_table.update()
+            .where(result_table.c.id.in_(select([reset.c.base_result_id])))
+            .values(status=literal(RecordStatusEnum.incomplete, result_table.c.status.type), modified_on=literal(now))
+            .returning(result_table.c.id)
+            .cte("results")
+        )
+        stmt = (
+            select([deactivated.c.name, func.count(reset.c.manager)])
+            .select_from(
+                deactivated.outerjoin(reset, reset.c.manager == deactivated.c.name).outerjoin(
+                    results, results.c.id == reset.c.base_result_id
+                )
+            )
+            .group_by(deactivated.c.name)
+        )
+
+        with self.session_scope() as session:
+            return {name: n_returned for name, n_returned in session.execute(stmt)}
+
     def _copy_managers(self, record_list: Dict):
         """
         copy the given managers as-is to the DB. Used for data migration
@@ -2749,24 +2949,25 @@ class SQLAlchemySocket:
 
         manager_names = []
         with self.session_scope() as session:
-            for manager in record_list:
-                doc = session.query(QueueManagerORM).filter_by(name=manager["name"])
+            # Look up all of the existing managers at once rather than one query per manager
+            names = [manager["name"] for manager in record_list]
+            existing = {r.name for r in session.query(QueueManagerORM.name).filter(QueueManagerORM.name.in_(names))}
 
-                if get_count_fast(doc) == 0:
+            for manager in record_list:
+                if manager["name"] not in existing:
                     doc = QueueManagerORM(**manager)
                     if isinstance(doc.created_on, float):
                         doc.created_on = dt.fromtimestamp(doc.created_on / 1e3)
                     if isinstance(doc.modified_on, float):
                         doc.modified_on = dt.fromtimestamp(doc.modified_on / 1e3)
-                    session.add(doc)
-                    session.commit()  # TODO: faster if done in bulk
+                    session.add(doc)  # flushed all at once when the session commits
+                    existing.add(doc.name)
                     manager_names.append(doc.name)
                     meta["n_inserted"] += 1
                 else:
-                    name = doc.first().name
-                    meta["duplicates"].append(name)  # TODO
-                    # If new or duplicate, add the id to the return list
-                    manager_names.append(id)
+                    meta["duplicates"].append(manager["name"])  # TODO
+                    # If new or duplicate, add the name to the return list
+                    manager_names.append(manager["name"])
         meta["success"] = True
 
         ret = {"data": manager_names, "meta": meta}
@@ -3144,10 +3345,9 @@ class SQLAlchemySocket:
 
         with self.session_scope() as session:
             pose = session.query(ServerStatsLogORM).filter(*query).order_by(desc("timestamp"))
-            meta["n_found"] = get_count_fast(pose)
-
-            data = pose.limit(self.get_limit(limit)).offset(skip).all()
-            data = [d.to_dict() for d in data]
+            limit = self.get_limit(limit)
+            data = [d.to_dict() for d in pose.limit(limit).offset(skip)]
+            meta["n_found"] = get_page_count(pose, len(data), limit, skip)
 
         meta["success"] = True
 
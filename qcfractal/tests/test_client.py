@@ -91,10 +91,11 @@ def test_empty_query(test_server, encoding):
     assert "ID is required" in str(error.value)
 
 
+@pytest.mark.parametrize("trusted", [False, True])
 @pytest.mark.parametrize("encoding", valid_encodings)
-def test_collection_portal(test_server, encoding):
+def test_collection_portal(test_server, encoding, trusted):
 
-    db_name = f"Torsion123-{encoding}"
+    db_name = f"Torsion123-{encoding}-{trusted}"
     db = {
         "collection": "torsiondrive",
         "name": db_name,
@@ -109,7 +110,7 @@ def test_collection_portal(test_server, encoding):
     client._set_encoding(encoding)
 
     # Test add
-    ret = client.add_collection(db, full_return=True)
+    ret = client.add_collection(db, full_return=True, trusted=trusted)
     print(ret)
 
     # Test get
@@ -128,22 +129,22 @@ def test_collection_portal(test_server, encoding):
     assert db == get_db.data[0]
 
     # Test add w/o overwrite
-    ret = client.add_collection(db, full_return=True)
+    ret = client.add_collection(db, full_return=True, trusted=trusted)
     assert ret.meta.success is False
 
     # Test that client is smart enough to trap non-id'ed overwrites
     with pytest.raises(KeyError):
-        _ = client.add_collection(db, overwrite=True)
+        _ = client.add_collection(db, overwrite=True, trusted=trusted)
 
     # Test that we cannot use a local key
     db["id"] = "local"
     db["array"] = ["6789"]
     with pytest.raises(KeyError):
-        _ = client.add_collection(db, overwrite=True)
+        _ = client.add_collection(db, overwrite=True, trusted=trusted)
 
     # Finally test that we can overwrite
     db["id"] = db_id
-    r = client.add_collection(db, overwrite=True)
+    r = client.add_collection(db, overwrite=True, trusted=trusted)
     get_db = client.get_collection(db["collection"], db["name"], full_return=True)
     assert get_db.data[0]["array"] == ["6789"]
 
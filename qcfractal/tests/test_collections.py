@@ -496,6 +496,57 @@ def test_dataset_compute_response(fractal_compute_server):
     assert len(response.ids) == 2
 
 
+def test_dataset_save_molecule_chunks(fractal_compute_server):
+    """Molecules uploaded in several concurrent chunks must keep their entries"""
+    client = ptl.FractalClient(fractal_compute_server)
+    client.query_limit = 2
+
+    ds = ptl.collections.Dataset("molecule_chunks", client, default_program="rdkit", default_driver="energy")
+    mols = {f"He{i}": ptl.Molecule.from_data(f"He 0 0 0\n--\nHe 0 0 {1 + 0.1 * i}") for i in range(7)}
+    for name, mol in mols.items():
+        ds.add_entry(name, mol)
+
+    ds.save()
+
+    ds = client.get_collection("dataset", "molecule_chunks")
+    molecules = ds.get_molecules()
+    for name, mol in mols.items():
+        assert molecules.loc[name, "molecule"].get_hash() == mol.get_hash()
+
+
+@pytest.mark.parametrize("encoding", ["json", "json-ext", "msgpack-ext"])
+def test_dataset_save_contributed_values(fractal_compute_server, encoding):
+    """Contributed values hold numpy arrays and missing values, both must survive a save"""
+    client = ptl.FractalClient(fractal_compute_server)
+    client._set_encoding(encoding)
+
+    name = f"contributed_save_{encoding}"
+    ds = ptl.collections.Dataset(name, client, default_program="rdkit", default_driver="energy")
+    ds.add_entry("He1", ptl.Molecule.from_data("He -1 0 0\n--\nHe 0 0 1"))
+    ds.add_entry("He2", ptl.Molecule.from_data("He -1.1 0 0\n--\nHe 0 0 1.1"))
+    ds.save()
+
+    ds.add_contributed_values(
+        {
+            "name": "Energy",
+            "theory_level": "pseudo-random values",
+            "values": [0.5, np.nan],
+            "index": ["He1", "He2"],
+            "theory_level_details": {"driver": "energy"},
+            "units": "hartree",
+        }
+    )
+    ds.save()
+
+    ds = client.get_collection("dataset", name)
+    ds._ensure_contributed_values()
+    contributed = ds.data.contributed_values["energy"]
+    assert list(contributed.index) == ["He1", "He2"]
+    assert contributed.values.dtype == np.float64
+    assert contributed.values[0] == 0.5
+    assert np.isnan(contributed.values[1])
+
+
 @testing.using_psi4
 def test_dataset_protocols(fractal_compute_server):
     """Tests using protocols with dataset compute."""
@@ -1393,8 +1444,14 @@ def test_optimization_dataset(fractal_compute_server):
     ds.add_entry("hooh1-2", hooh1)
     ds.add_entry("hooh2", hooh2)
 
-    ds.compute("test")
-    ds.compute("test2", subset=["hooh1"])
+    assert ds.compute("test") == 3
+    assert ds.compute("test2", subset=["hooh1"]) == 1
+
+    # Entries are submitted together, ids must still line up with the molecules
+    assert ds.get_entry("hooh1").object_map["test"] == ds.get_entry("hooh1-2").object_map["test"]
+    assert ds.get_entry("hooh1").object_map["test"] != ds.get_entry("hooh2").object_map["test"]
+    assert ds.compute("test") == 0
+
     fractal_compute_server.await_results()
 
     ds.query("test")
@@ -1421,6 +1478,60 @@ def test_optimization_dataset(fractal_compute_server):
     assert pytest.approx(opt.get_final_energy(), abs=1.0e-5) == final_energy
 
 
+def test_optimization_dataset_deferred_save(fractal_compute_server):
+
+    client = ptl.FractalClient(fractal_compute_server)
+
+    ds = ptl.collections.OptimizationDataset("testing_deferred_save", client=client)
+    hooh = ptl.data.get_molecule("hooh.json")
+
+    before = client._request_counter[("collection", "post")]
+    with ds.deferred_save():
+        ds.add_specification(
+            "test", {"program": "geometric"}, {"driver": "gradient", "method": "UFF", "program": "rdkit"}
+        )
+        with ds.deferred_save():
+            ds.add_entry("hooh1", hooh)
+            ds.add_entry("hooh2", hooh)
+
+        assert client._request_counter[("collection", "post")] == before
+
+    # A single upload once the outermost block exits
+    assert client._request_counter[("collection", "post")] == before + 1
+
+    ds = client.get_collection("optimizationdataset", "testing_deferred_save")
+    assert ds.list_specifications(description=False) == ["test"]
+    assert {x.name for x in ds.data.records.values()} == {"hooh1", "hooh2"}
+
+    # Saves are not deferred outside of the block
+    ds.add_entry("hooh3", hooh)
+    assert client._request_counter[("collection", "post")] == before + 2
+
+
+def test_optimization_dataset_get_specification(fractal_compute_server):
+
+    client = ptl.FractalClient(fractal_compute_server)
+
+    ds = ptl.collections.OptimizationDataset("testing_get_specification", client=client)
+    ds.add_specification("Test", {"program": "geometric"}, {"driver": "gradient", "method": "UFF", "program": "rdkit"})
+
+    # The public accessor hands out a copy which is safe to modify
+    spec = ds.get_specification("TEST")
+    assert spec == ds.data.specs["test"]
+    assert spec is not ds.data.specs["test"]
+    assert ds._get_specification("TEST") is ds.data.specs["test"]
+
+    with pytest.raises(KeyError):
+        ds.get_specification("missing")
+
+    # Several specifications are fetched together and mapped back to their stored names
+    ds.add_specification(
+        "Other", {"program": "geometric"}, {"driver": "gradient", "method": "MMFF94", "program": "rdkit"}
+    )
+    assert ds._query_many(["TEST", "other", "Test"]) == ["Test", "Other", "Test"]
+    assert list(ds.df.columns) == ["Test", "Other"]
+
+
 @testing.using_geometric
 @testing.using_rdkit
 def test_grid_optimization_dataset(fractal_compute_server):
@@ -17,6 +17,7 @@ from qcfractal.storage_sockets.models import (
     MoleculeORM,
     OptimizationHistory,
     OptimizationProcedureORM,
+    QueueManagerORM,
     ResultORM,
     ServiceQueueORM,
     TaskQueueORM,
@@ -492,3 +493,18 @@ def test_results_pagination(storage_socket, session, molecules_H4O2, kw_fixtures
 
     # cleanup
     session_delete_all(session, ResultORM)
+
+
+def test_manager_update_skip_locked(storage_socket, session):
+
+    assert storage_socket.manager_update(name="locked_manager")
+
+    # Hold the manager row lock from another transaction
+    session.query(QueueManagerORM).filter_by(name="locked_manager").with_for_update().one()
+    try:
+        assert storage_socket.manager_update(name="locked_manager", status="ACTIVE", skip_locked=True) is False
+    finally:
+        session.rollback()
+
+    assert storage_socket.manager_update(name="locked_manager", status="ACTIVE", skip_locked=True)
+    assert storage_socket.get_managers(name="locked_manager")["data"][0]["status"] == "ACTIVE"
@@ -614,7 +614,11 @@ def test_results_get_total(storage_results):
 
 
 def test_results_get_0(storage_results):
-    assert 0 == len(storage_results.get_results(limit=0)["data"])
+    ret = storage_results.get_results(limit=0)
+    assert 0 == len(ret["data"])
+
+    # limit=0 still reports the total count
+    assert ret["meta"]["n_found"] == 6
 
 
 def test_get_results_by_ids(storage_results):
@@ -819,6 +823,53 @@ def test_queue_submit_many_order(storage_results):
     # Todo: test more scenarios
 
 
+def test_queue_deactivate_managers(storage_results):
+
+    results = storage_results.get_results()["data"]
+
+    task_template = {
+        "spec": {"function": "qcengine.compute_procedure", "args": [{"json_blob": "data"}], "kwargs": {}},
+        "tag": None,
+        "program": "P1",
+        "procedure": "P1",
+        "parser": "",
+    }
+
+    tasks = [ptl.models.TaskRecord(**task_template, base_result=results[i]["id"]) for i in range(3)]
+    ret = storage_results.queue_submit(tasks)
+    assert ret["meta"]["n_inserted"] == 3
+
+    storage_results.manager_update("dead_manager1", status="ACTIVE")
+    storage_results.manager_update("dead_manager2", status="ACTIVE")
+    storage_results.manager_update("dead_manager3", status="ACTIVE")
+
+    assert len(storage_results.queue_get_next("dead_manager1", ["p1"], ["p1"], limit=2)) == 2
+    assert len(storage_results.queue_get_next("dead_manager2", ["p1"], ["p1"], limit=1)) == 1
+
+    deactivated = storage_results.deactivate_managers(["dead_manager1", "dead_manager2", "dead_manager3"])
+    assert deactivated == {"dead_manager1": 2, "dead_manager2": 1, "dead_manager3": 0}
+
+    managers = storage_results.get_managers(status="INACTIVE")["data"]
+    managers = {m["name"]: m for m in managers}
+    assert managers["dead_manager1"]["returned"] == 2
+    assert managers["dead_manager2"]["returned"] == 1
+    assert managers["dead_manager3"]["returned"] == 0
+
+    # All tasks went back to the queue
+    assert len(storage_results.get_queue(status="WAITING")["data"]) == 3
+    records = storage_results.get_results(id=[results[i]["id"] for i in range(3)])["data"]
+    assert {r["status"] for r in records} == {"INCOMPLETE"}
+    assert storage_results.deactivate_managers([]) == {}
+
+    # Already inactive managers are left alone
+    assert storage_results.deactivate_managers(["dead_manager1"]) == {}
+
+    storage_results.manager_update("dead_manager3", status="ACTIVE")
+    deactivated = storage_results.deactivate_managers(modified_before=datetime.utcnow())
+    assert deactivated["dead_manager3"] == 0
+    assert "dead_manager1" not in deactivated
+
+
 # User testing
 
 
@@ -903,11 +954,67 @@ def test_manager(storage_socket):
     assert storage_socket.manager_update(name="first_manager", submitted=100)
     assert storage_socket.manager_update(name="first_manager", submitted=50)
 
+    # Row is not locked by anyone else, so skip_locked still updates
+    assert storage_socket.manager_update(name="first_manager", skip_locked=True)
+
     ret = storage_socket.get_managers(name="first_manager")
     assert ret["data"][0]["submitted"] == 150
 
     ret = storage_socket.get_managers(name="first_manager", modified_before=datetime.utcnow())
     assert len(ret["data"]) == 1
+    assert ret["meta"]["n_found"] == 1
+
+    # Count is still correct when paging past the end
+    ret = storage_socket.get_managers(name="first_manager", skip=1)
+    assert len(ret["data"]) == 0
+    assert ret["meta"]["n_found"] == 1
+
+    # limit=0 returns no rows but still counts them
+    ret = storage_socket.get_managers(name="first_manager", limit=0)
+    assert len(ret["data"]) == 0
+    assert ret["meta"]["n_found"] == 1
+
+    ret = storage_socket.get_managers(name="no_manager")
+    assert len(ret["data"]) == 0
+    assert ret["meta"]["n_found"] == 0
+
+    ret = storage_socket.get_managers(name=["first_manager", "no_manager"], status=["ACTIVE", "INACTIVE"])
+    assert len(ret["data"]) == 1
+    assert ret["data"][0]["name"] == "first_manager"
+
+
+def test_copy_managers(storage_socket):
+
+    assert storage_socket.manager_update(name="copy_existing")
+
+    ret = storage_socket._copy_managers([{"name": "copy_new"}, {"name": "copy_existing"}, {"name": "copy_new"}])
+    assert ret["data"] == ["copy_new", "copy_existing", "copy_new"]
+    assert ret["meta"]["n_inserted"] == 1
+    assert ret["meta"]["duplicates"] == ["copy_existing", "copy_new"]
+
+    assert len(storage_socket.get_managers(name="copy_new")["data"]) == 1
+
+
+def test_manager_log(storage_socket):
+
+    assert storage_socket.manager_update(name="log_manager", log=True)
+    assert storage_socket.manager_update(
+        name="log_manager", completed=2, total_worker_walltime=2.5, total_task_walltime=1.5, log=True
+    )
+
+    manager = storage_socket.get_managers(name="log_manager")["data"][0]
+    assert manager["total_task_walltime"] == 1.5
+
+    logs = storage_socket.get_manager_logs(manager["id"])["data"]
+    assert len(logs) == 2
+
+    # Snapshot must hold the scalar stats of the manager
+    state = [x for x in logs if x["completed"] == 2]
+    assert len(state) == 1
+    state = state[0]
+    assert isinstance(state["total_task_walltime"], float)
+    assert state["total_task_walltime"] == 1.5
+    assert state["total_worker_walltime"] == 2.5
 
 
 def test_procedure_sql(storage_results):
@@ -1154,6 +1261,12 @@ def test_results_pagination(storage_socket):
     # get the last page when with fewer than limit are remaining
     ret = storage_socket.get_results(method="M1", skip=(int(first_half - limit / 2)), status=None)
     assert len(ret["data"]) == limit / 2
+    assert ret["meta"]["n_found"] == first_half
+
+    # skipped past the end, count is still the total
+    ret = storage_socket.get_results(method="M1", skip=first_half, status=None)
+    assert len(ret["data"]) == 0
+    assert ret["meta"]["n_found"] == first_half
 
     # cleanup
     storage_socket.del_results(inserted["data"])